@@ -0,0 +1,44 @@
+# feelings.csv から感情辞書のトライ（data/feelings.marisa）を作るスクリプト
+# 使い方: python build_feelings.py
+# アプリ起動時にもトライがない・CSV の方が新しい場合は build() で作り直す
+import csv
+import os
+import marisa_trie
+
+basedir = os.path.abspath(os.path.dirname(__file__))
+csv_path = os.path.join(basedir, 'data', 'feelings.csv')
+marisa_path = os.path.join(basedir, 'data', 'feelings.marisa')
+
+
+def is_stale():
+    return not os.path.exists(marisa_path) or os.path.getmtime(csv_path) > os.path.getmtime(marisa_path)
+
+
+def build():
+    # RecordTrie は同じ単語の値を全部持ち、CSV の順ではなく値の順で返すので、
+    # 先に辞書で1単語1件にしておく（同じ単語が複数行あれば後の行が優先）
+    polarity = {}
+    with open(csv_path, encoding="utf-8-sig") as f:  # BOM対策で utf-8-sig
+        reader = csv.DictReader(f)
+        for row in reader:
+            if not row["word"]:  # 空行ならスキップ
+                continue
+            # 値は極性（+1: positive / -1: negative）
+            polarity[row["word"]] = 1 if row["category"] == 'positive' else -1
+    rows = [(word, (pol,)) for word, pol in polarity.items()]
+
+    trie = marisa_trie.RecordTrie('<b', rows)
+    # 書きかけのファイルを他のプロセスが読まないよう、別名で保存してから置き換える
+    tmp_path = f"{marisa_path}.{os.getpid()}.tmp"
+    trie.save(tmp_path)
+    os.replace(tmp_path, marisa_path)
+    return len(rows)
+
+
+def main():
+    count = build()
+    print(f">>> Wrote {count} words to {marisa_path}")
+
+
+if __name__ == '__main__':
+    main()
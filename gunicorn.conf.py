@@ -0,0 +1,29 @@
+# gunicorn 設定（`gunicorn` だけで起動できる）
+# preload_app ではアプリがマスターで import されるので、その前に gevent のパッチを当てておく
+# （ワーカーがパッチを当てるのは fork 後なので、それより前に ssl などを読み込ませない）
+from gevent import monkey
+monkey.patch_all()
+
+import os
+
+wsgi_app = "shapediary_app:app"
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+# 画像生成ジョブ（pending_images）はプロセス内に持つので、完了確認も同じプロセスに届く必要がある
+# 同時処理は gevent が受け持つので、$WEB_CONCURRENCY に関係なくワーカーは1つに固定する
+workers = 1
+worker_class = "gevent"
+worker_connections = 100
+# 辞書の読み込みや JIT コンパイルはマスターで一度だけ行い、ワーカーは fork で共有する
+preload_app = True
+
+
+def on_starting(server):
+    # テーブル作成・マイグレーション（ワーカーごとではなく起動時に一度だけ）
+    from shapediary_app import app, init_db
+    init_db(app)
+
+
+def post_fork(server, worker):
+    # psycopg2 の待ち時間に他のリクエストへ切り替えられるようにする
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
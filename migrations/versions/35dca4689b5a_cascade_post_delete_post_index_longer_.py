@@ -0,0 +1,45 @@
+"""cascade post delete, post index, longer password
+
+Revision ID: 35dca4689b5a
+Revises: cc35cbb82f5e
+Create Date: 2026-10-15 00:42:20.888683
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '35dca4689b5a'
+down_revision = 'cc35cbb82f5e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ユーザー削除時に投稿も DB 側で削除する
+    op.drop_constraint('shapediary_post_user_id_fkey', 'shapediary_post', type_='foreignkey')
+    op.create_foreign_key(
+        'shapediary_post_user_id_fkey', 'shapediary_post', 'shapediary_user',
+        ['user_id'], ['id'], ondelete='CASCADE'
+    )
+    # index / edit の「ユーザーごとに新しい順」取得用
+    op.create_index('ix_post_user_date', 'shapediary_post', ['user_id', sa.text('date_created DESC')])
+    # argon2 のハッシュ用
+    op.alter_column(
+        'shapediary_user', 'password',
+        existing_type=sa.String(length=128), type_=sa.String(length=255)
+    )
+
+
+def downgrade():
+    op.alter_column(
+        'shapediary_user', 'password',
+        existing_type=sa.String(length=255), type_=sa.String(length=128)
+    )
+    op.drop_index('ix_post_user_date', table_name='shapediary_post')
+    op.drop_constraint('shapediary_post_user_id_fkey', 'shapediary_post', type_='foreignkey')
+    op.create_foreign_key(
+        'shapediary_post_user_id_fkey', 'shapediary_post', 'shapediary_user',
+        ['user_id'], ['id']
+    )
@@ -0,0 +1,43 @@
+"""initial schema
+
+Revision ID: cc35cbb82f5e
+Revises: 
+Create Date: 2026-10-15 00:42:20.431061
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cc35cbb82f5e'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Flask-Migrate 導入前に db.create_all() で作っていたテーブル
+    op.create_table(
+        'shapediary_user',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(length=30), nullable=False),
+        sa.Column('password', sa.String(length=128), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('username')
+    )
+    op.create_table(
+        'shapediary_post',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('date_created', sa.DateTime(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('image_path', sa.String(length=200), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['shapediary_user.id'], name='shapediary_post_user_id_fkey'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('shapediary_post')
+    op.drop_table('shapediary_user')